@@ -1,35 +1,82 @@
-from itertools import zip_longest
-from typing import Any, Iterable, Iterator, TypeVar
+from typing import Any, ClassVar, Dict, Iterable, Iterator, Optional, Tuple, Type, TypeVar, cast
 
 ONE = True
 ZERO = False
 Bit = bool
 
-bit_add = {
-    (ZERO, ZERO, ZERO): (ZERO, ZERO),
-    (ONE, ZERO, ZERO): (ONE, ZERO),
-    (ZERO, ONE, ZERO): (ONE, ZERO),
-    (ZERO, ZERO, ONE): (ONE, ZERO),
-    (ONE, ONE, ZERO): (ZERO, ONE),
-    (ONE, ZERO, ONE): (ZERO, ONE),
-    (ZERO, ONE, ONE): (ZERO, ONE),
-    (ONE, ONE, ONE): (ONE, ONE),
-}
+# Bitstrings built internally at or below this width are interned, per type.
+SMALL_CACHE_WIDTH = 8
+
+# Bits are stored one per byte, as 0x00 or 0x01. These tables convert to and from
+# the ASCII digits that `int` and `format` understand.
+_BITS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGITS_TO_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+BitStringTypeVar = TypeVar("BitStringTypeVar", bound="BitString")
 
 
 class BitString:
+    __slots__ = ("_bit_cache", "_int", "_width", "_str_cache")
+
+    _small_cache: ClassVar[Dict[Tuple[int, int], "BitString"]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each type gets its own cache, so a cached value never turns up as the wrong type.
+        cls._small_cache = {}
+
     def __init__(self, sequence: Iterable[Bit]):
         # Make a new, immutable, copy of input sequence, so there's
         # no spooky action-at-a-distance by mutation.
         # Also ensures that BitString is multiply iterable.
         # This propety should never need to be accessed outside of this module.
-        self._bits = tuple(sequence)
+        # Storing one byte per bit, rather than a tuple of bools, keeps this compact.
+        bits = bytes(map(bool, sequence))
+        self._bit_cache: Optional[bytes] = bits
+        # The bits packed into a single python int, least-significant bit first,
+        # so that arithmetic can be handed off to CPython's bignum routines.
+        self._width = len(bits)
+        self._int = int(bits[::-1].translate(_BITS_TO_DIGITS), 2) if bits else 0
+        self._str_cache: Optional[str] = None
+
+    @classmethod
+    def _from_int(cls: Type[BitStringTypeVar], value: int, width: int) -> BitStringTypeVar:
+        """
+        Build a bitstring of the given width directly from its packed int value.
+        `value` must already fit in `width` bits. Skips copying a bit sequence,
+        so internal arithmetic should build its results this way.
+        Narrow bitstrings are shared, since nothing ever mutates one.
+        """
+        key = (value, width)
+        if width <= SMALL_CACHE_WIDTH:
+            cached = cls._small_cache.get(key)
+            if cached is not None:
+                return cast(BitStringTypeVar, cached)
+        self = cls.__new__(cls)
+        self._bit_cache = None
+        self._width = width
+        self._int = value
+        self._str_cache = None
+        if width <= SMALL_CACHE_WIDTH:
+            cls._small_cache[key] = self
+        return self
+
+    @property
+    def _bits(self) -> bytes:
+        """
+        The individual bits, one byte each, least-significant first. Unpacked from
+        `_int` on first access for bitstrings built by `_from_int`.
+        """
+        if self._bit_cache is None:
+            digits = format(self._int, f"0{self._width}b") if self._width else ""
+            self._bit_cache = digits[::-1].encode("ascii").translate(_DIGITS_TO_BITS)
+        return self._bit_cache
 
     def __iter__(self) -> Iterator[Bit]:
         """
         Iterating over a bitstring yields the individual bits.
         """
-        yield from self._bits
+        yield from map(bool, self._bits)
 
 
 IntTypeVar = TypeVar("IntTypeVar", bound="Integer")
@@ -43,18 +90,27 @@ class Integer(BitString):
     i.e., from least to most significant.
     """
 
+    __slots__ = ()
+
     def __eq__(bits1: IntTypeVar, bits2: Any) -> bool:
         """
         Two bitstring integers are here defined as equal iff every bit up to the
         most significant ONE is equal. Different numbers of ZEROS after
         that make no difference.
         """
-        if not type(bits1) == type(bits2):
+        # Requiring the exact same type, rather than using `isinstance`, keeps this symmetric.
+        if type(bits2) is not type(bits1):
             return False
-        for bit1, bit2 in zip_longest(bits1, bits2, fillvalue=ZERO):
-            if bit1 != bit2:
-                return False
-        return True
+        # Trailing ZEROs contribute nothing to the packed value. Comparing the ints
+        # rejects values of different magnitude in constant time.
+        return bits1._int == bits2._int
+
+    def __hash__(self) -> int:
+        """
+        Hash agrees with `__eq__`: integers that differ only in trailing ZEROs
+        hash the same.
+        """
+        return hash((type(self), self._int))
 
     def __add__(bits1: IntTypeVar, bits2: IntTypeVar) -> IntTypeVar:
         """
@@ -62,18 +118,30 @@ class Integer(BitString):
         w is the width of the wider of bits1 and bits2.
         """
         # None of this dodgy type-casting between binary and twos-compliment.
-        if type(bits1) != type(bits2):
+        int_type = type(bits1)
+        if type(bits2) is not int_type:
+            raise ValueError(
+                f"Summands must be of same type. Left summand has type {int_type}; tight summand has type {type(bits2)}."
+            )
+        width = max(bits1._width, bits2._width)
+        # Masking off everything above the top bit discards the final carry,
+        # giving the sum modulo 2^w.
+        total = (bits1._int + bits2._int) & ((1 << width) - 1)
+        return int_type._from_int(total, width)
+
+    def __mul__(bits1: IntTypeVar, bits2: IntTypeVar) -> IntTypeVar:
+        """
+        Return new bitstring representing product of bits1 and bits2, modulo 2^w, where
+        w is the width of the wider of bits1 and bits2.
+        """
+        int_type = type(bits1)
+        if type(bits2) is not int_type:
             raise ValueError(
-                f"Summands must be of same type. Left summand has type {type(bits1)}; tight summand has type {type(bits2)}."
+                f"Factors must be of same type. Left factor has type {int_type}; right factor has type {type(bits2)}."
             )
-        return_val = []
-        carry = ZERO
-        # The `zip_longest` implicitly casts the shorter bitstring to the same
-        # size as the longer bitstring by padding with ZEROs
-        for bit1, bit2 in zip_longest(bits1, bits2, fillvalue=ZERO):
-            next_digit, carry = bit_add[(bit1, bit2, carry)]
-            return_val.append(next_digit)
-        return type(bits1)(return_val)
+        width = max(bits1._width, bits2._width)
+        product = (bits1._int * bits2._int) & ((1 << width) - 1)
+        return int_type._from_int(product, width)
 
     def __lshift__(self: IntTypeVar, shift: IntTypeVar) -> IntTypeVar:
         """
@@ -82,41 +150,44 @@ class Integer(BitString):
         of `self`; if `shift` is greater than the width of `self`, the result will be
         an all ZERO bitstring.
         """
-        self_iter = iter(self)
-        return_seq = [ZERO for _ in zip(self_iter, shift.count_iter())]
-        for _, bit in zip(self_iter, self):
-            return_seq.append(bit)
-        return type(self)(return_seq)
+        steps = shift._as_int()
+        width = self._width
+        if steps >= width:
+            # Avoid building a huge int only to mask all of it away.
+            return type(self)._from_int(0, width)
+        return type(self)._from_int((self._int << steps) & ((1 << width) - 1), width)
+
+    def _as_int(self) -> int:
+        """
+        The value of this bitstring as a python int, reading it as unsigned binary.
+        """
+        return self._int
 
     def __str__(self: "Integer") -> str:
         """
         String representation uses `1` for ONE and `0` for ZERO values.
 
-        Order is `reverse`d because the standard convention is to write out bitstrings
-        with the most significant digit on the left, and the least on the right, whereas
-        the standard way of writing out sequences is first element on the left and last on
-        the right. These two conventions clash here, because the first element in our integers
-        are the least significant, and the last the most.
+        The most significant digit is written on the left, and the least on the right, as
+        is standard for bitstrings -- which is the reverse of iteration order, because the
+        first element in our integers is the least significant, and the last the most.
+        Formatting the packed int gives exactly that, zero-padded out to the full width.
         """
-        bits_in_ints = ["1" if bit else "0" for bit in self]
-        bits_in_ints.reverse()
-        return "".join(bits_in_ints)
+        if self._str_cache is None:
+            # A width of zero would still format as "0", so special-case it.
+            self._str_cache = format(self._int, f"0{self._width}b") if self._width else ""
+        return self._str_cache
 
     def count_iter(self: IntTypeVar) -> Iterator[IntTypeVar]:
-        increment = type(self)([ONE])
-
-        count = type(self)([ZERO for _ in self._bits])
-        while True:
-            if count == self:
-                break
-            else:
-                yield count
-                count += increment
+        """
+        Yield every integer of `self`'s width from zero up to, but not including, `self`.
+        """
+        for value in range(self._as_int()):
+            yield type(self)._from_int(value, self._width)
 
 
 class BinaryInt(Integer):
-    ...
+    __slots__ = ()
 
 
 class TwosComplimentInt(Integer):
-    ...
+    __slots__ = ()
@@ -2,7 +2,7 @@ from typing import Sequence
 
 import pytest
 
-from arithmetic import ONE, ZERO, BinaryInt, Bit
+from arithmetic import ONE, ZERO, BinaryInt, Bit, TwosComplimentInt
 
 
 def test_iter() -> None:
@@ -30,6 +30,19 @@ def test_equal(bits1: Sequence[Bit], bits2: Sequence[Bit], expected: bool) -> No
     assert (BinaryInt(bits1) == BinaryInt(bits2)) is expected
 
 
+def test_equal_across_types() -> None:
+    binary, twos_compliment = BinaryInt([ONE, ZERO, ONE]), TwosComplimentInt([ONE, ZERO, ONE])
+    assert binary != twos_compliment
+    assert twos_compliment != binary
+    assert binary != [ONE, ZERO, ONE]
+
+
+def test_hash() -> None:
+    counts = {BinaryInt([ONE, ZERO, ONE]): 1}
+    counts[BinaryInt([ONE, ZERO, ONE, ZERO, ZERO])] += 1
+    assert counts == {BinaryInt([ONE, ZERO, ONE]): 2}
+
+
 add_test_data = [
     ([ZERO, ZERO, ONE, ONE, ZERO], [ZERO, ONE, ZERO, ONE, ZERO], [ZERO, ONE, ONE, ZERO, ONE]),
     ([ZERO, ZERO, ONE, ONE, ZERO], [ZERO, ONE, ZERO, ONE], [ZERO, ONE, ONE, ZERO, ONE]),
@@ -43,6 +56,40 @@ def test_add(bits1: Sequence[Bit], bits2: Sequence[Bit], sum: Sequence[Bit]) ->
     assert BinaryInt(bits1) + BinaryInt(bits2) == BinaryInt(sum)
 
 
+mul_test_data = [
+    ([ONE, ONE, ZERO, ZERO], [ZERO, ONE, ZERO, ZERO], [ZERO, ONE, ONE, ZERO]),
+    ([ONE, ONE, ZERO, ZERO], [ONE, ONE], [ONE, ZERO, ZERO, ONE]),
+    ([ONE, ONE, ONE, ONE], [ONE, ONE, ONE, ONE], [ONE, ZERO, ZERO, ZERO]),
+    ([ONE, ZERO, ONE], [ZERO], [ZERO, ZERO, ZERO]),
+]
+
+
+@pytest.mark.parametrize(["bits1", "bits2", "product"], mul_test_data)
+def test_mul(bits1: Sequence[Bit], bits2: Sequence[Bit], product: Sequence[Bit]) -> None:
+    assert BinaryInt(bits1) * BinaryInt(bits2) == BinaryInt(product)
+
+
+def test_add_mixed_types() -> None:
+    with pytest.raises(ValueError):
+        BinaryInt([ONE]) + TwosComplimentInt([ONE])  # type: ignore[operator]
+
+
+def test_small_results_shared() -> None:
+    assert BinaryInt([ONE, ZERO]) + BinaryInt([ONE]) is BinaryInt([ZERO, ONE]) + BinaryInt([ZERO])
+
+
+str_test_data = [
+    ([ONE, ZERO, ONE, ONE, ZERO], "01101"),
+    ([ZERO, ZERO, ZERO], "000"),
+    ([], ""),
+]
+
+
+@pytest.mark.parametrize(["bits", "expected"], str_test_data)
+def test_str(bits: Sequence[Bit], expected: str) -> None:
+    assert str(BinaryInt(bits)) == expected
+
+
 def test_count_iter() -> None:
     assert [bitstring for bitstring in BinaryInt([ONE, ZERO, ONE]).count_iter()] == [
         BinaryInt([ZERO, ZERO, ZERO]),
@@ -51,3 +98,18 @@ def test_count_iter() -> None:
         BinaryInt([ONE, ONE, ZERO]),
         BinaryInt([ZERO, ZERO, ONE]),
     ]
+
+
+lshift_test_data = [
+    ([ONE, ZERO, ONE, ONE], [ZERO], [ONE, ZERO, ONE, ONE]),
+    ([ONE, ZERO, ONE, ONE], [ONE], [ZERO, ONE, ZERO, ONE]),
+    ([ONE, ZERO, ONE, ONE], [ONE, ONE], [ZERO, ZERO, ZERO, ONE]),
+    ([ONE, ZERO, ONE, ONE], [ZERO, ZERO, ONE], [ZERO, ZERO, ZERO, ZERO]),
+    ([ONE, ZERO, ONE, ONE], [ONE, ONE, ONE, ONE, ONE, ONE], [ZERO, ZERO, ZERO, ZERO]),
+]
+
+
+@pytest.mark.parametrize(["bits", "shift", "expected"], lshift_test_data)
+def test_lshift(bits: Sequence[Bit], shift: Sequence[Bit], expected: Sequence[Bit]) -> None:
+    result = BinaryInt(bits) << BinaryInt(shift)
+    assert list(result) == expected